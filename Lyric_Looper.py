@@ -8,10 +8,17 @@ Supports video export to AVI, MP4, MOV, and ProRes 4444 formats with loop suppor
 import tkinter as tk
 from tkinter import ttk, colorchooser, font as tkfont, filedialog, messagebox
 import threading
+import queue
 import time
 import os
 import tempfile
 import json
+import shutil
+import subprocess
+import bisect
+from functools import lru_cache
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 # Audio dependencies for metronome
 try:
@@ -21,15 +28,75 @@ try:
 except ImportError:
     AUDIO_AVAILABLE = False
 
+# NumPy speeds up click synthesis (and is required for video export)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 # Video export dependencies
 try:
     import cv2
-    import numpy as np
     from PIL import Image, ImageDraw, ImageFont
-    VIDEO_EXPORT_AVAILABLE = True
+    VIDEO_EXPORT_AVAILABLE = NUMPY_AVAILABLE
 except ImportError:
     VIDEO_EXPORT_AVAILABLE = False
 
+# Windows multimedia timers; waits are only as fine as the ~15.6 ms system tick without them
+try:
+    import ctypes
+    WINMM = ctypes.WinDLL('winmm')
+except (ImportError, AttributeError, OSError):
+    WINMM = None
+
+NS_PER_SEC = 1_000_000_000
+
+
+@lru_cache(maxsize=16)
+def hex_to_rgb(hex_color):
+    v = int(hex_color.lstrip('#'), 16)
+    return (v >> 16) & 0xFF, (v >> 8) & 0xFF, v & 0xFF
+
+
+@lru_cache(maxsize=1024)
+def _blend_color_cached(fg, bg, level):
+    # Blend on packed 0xRRGGBB ints, weights out of 256: red and blue share one multiply
+    # (each lane has 16 bits of headroom) and green gets the other
+    fg_p = int(fg.lstrip('#'), 16)
+    bg_p = int(bg.lstrip('#'), 16)
+    inv = 256 - level
+    rb = ((fg_p & 0xFF00FF) * level + (bg_p & 0xFF00FF) * inv) >> 8 & 0xFF00FF
+    g = ((fg_p & 0x00FF00) * level + (bg_p & 0x00FF00) * inv) >> 8 & 0x00FF00
+    return '#%06x' % (rb | g)
+
+
+def blend_color(fg, bg, opacity):
+    """Blend two hex colors; results are cached per (fg, bg, opacity) at 1/256 steps"""
+    return _blend_color_cached(fg, bg, round(opacity * 256))
+
+
+@lru_cache(maxsize=4)
+def fade_lut(fg, bg):
+    """256-entry table of blended colors, indexed by round(opacity * 255)"""
+    return tuple(blend_color(fg, bg, o / 255) for o in range(256))
+
+
+@lru_cache(maxsize=8)
+def get_pil_font(font_path, size):
+    """Load a PIL font once per (path, size), falling back to PIL's default font"""
+    try:
+        return ImageFont.truetype(font_path, size) if font_path else ImageFont.load_default()
+    except Exception:
+        return ImageFont.load_default()
+
+
+@lru_cache(maxsize=None)
+def beat_colors(beat, ts):
+    """Colors of the 16 beat indicators with `beat` lit in a bar of `ts` beats"""
+    return tuple("#111" if i >= ts else "#666" if i != beat else "#F50" if i == 0 else "#0F0"
+                 for i in range(16))
+
 
 class MetronomeSound:
     def __init__(self):
@@ -38,16 +105,30 @@ class MetronomeSound:
         self.sample_rate = 44100
         self.click_sound = self._generate_click()
         self.accent_sound = self._generate_click(freq=1200, duration=0.03)
+        # Reserved channels, so a click never has to search the mixer for a free one
+        pygame.mixer.set_reserved(2)
+        self.click_channel = pygame.mixer.Channel(0)
+        self.accent_channel = pygame.mixer.Channel(1)
         
     def _generate_click(self, freq=800, duration=0.02):
-        import array, math
         n_samples = int(self.sample_rate * duration)
-        samples = array.array('h')
-        for i in range(n_samples):
-            t = i / self.sample_rate
-            envelope = math.exp(-t * 100)
-            value = int(32767 * envelope * math.sin(2 * math.pi * freq * t))
-            samples.append(value)
+        if NUMPY_AVAILABLE:
+            # Work in place so only the time and wave buffers are ever allocated
+            t = np.arange(n_samples, dtype=np.float32)
+            t /= self.sample_rate
+            wave = np.sin(t * np.float32(2 * np.pi * freq))
+            t *= -100
+            np.exp(t, out=t)
+            wave *= t
+            wave *= 32767
+            samples = wave.astype(np.int16)
+        else:
+            import array, math
+            samples = array.array('h')
+            for i in range(n_samples):
+                t = i / self.sample_rate
+                envelope = math.exp(-t * 100)
+                samples.append(int(32767 * envelope * math.sin(2 * math.pi * freq * t)))
         sound = pygame.mixer.Sound(buffer=samples.tobytes())
         sound.set_volume(0.5)
         return sound
@@ -55,7 +136,56 @@ class MetronomeSound:
     def play_click(self, accent=False):
         if not AUDIO_AVAILABLE:
             return
-        (self.accent_sound if accent else self.click_sound).play()
+        if accent:
+            self.accent_channel.play(self.accent_sound)
+        else:
+            self.click_channel.play(self.click_sound)
+
+
+class FFmpegWriter:
+    """Minimal cv2.VideoWriter stand-in that pipes raw BGR(A) frames to FFmpeg's ProRes 4444 encoder"""
+    def __init__(self, ffmpeg, filename, fps, size, alpha=False):
+        self.proc = subprocess.Popen(
+            [ffmpeg, '-y', '-loglevel', 'error',
+             '-f', 'rawvideo', '-pix_fmt', 'bgra' if alpha else 'bgr24',
+             '-s', f'{size[0]}x{size[1]}', '-r', str(fps), '-i', '-',
+             '-c:v', 'prores_ks', '-profile:v', '4', '-pix_fmt', 'yuva444p10le' if alpha else 'yuv444p10le',
+             filename],
+            stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, bufsize=0,
+            creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0))  # No console window on Windows
+        
+    def isOpened(self):
+        return self.proc.poll() is None
+        
+    def write(self, frame):
+        try:
+            self.proc.stdin.write(frame.data)
+        except OSError:  # FFmpeg exited early: bad output path, missing encoder, ...
+            raise Exception(self._failure()) from None
+        
+    def release(self):
+        self.proc.stdin.close()
+        if self.proc.wait() != 0:
+            raise Exception(self._failure())
+        self.proc.stderr.close()
+        
+    def kill(self):
+        """Abandon the output of a failed export"""
+        if self.proc.poll() is None:
+            self.proc.kill()
+        self._failure()
+        
+    def _failure(self):
+        """Reap FFmpeg, close its pipes, and describe the failure from its stderr"""
+        try:
+            self.proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+            self.proc.wait()
+        error = self.proc.stderr.read().decode(errors='replace').strip()
+        self.proc.stdin.close()
+        self.proc.stderr.close()
+        return f"FFmpeg failed: {error or f'exit code {self.proc.returncode}'}"
 
 
 class TextVideoPlayer:
@@ -68,12 +198,26 @@ class TextVideoPlayer:
         self.is_playing = False
         self.is_paused = False
         self.current_word_index = 0
-        self.words = []
+        self.words = ()
+        self._loaded_text = None  # Text that self.words was last split from
         self.play_thread = None
+        self._wake = threading.Event()  # Set by stop() to cut the playback thread's waits short
+        self._pause_cond = threading.Condition()  # Notified when a pause ends or playback stops
+        self._seek_to = None  # Word index the playback thread should jump to, set by on_seek
+        # UI updates posted by the playback thread: newest state per key, plus one-off callbacks
+        self._ui_pending = {}
+        self._ui_queue = deque()
+        self._ui_draining = False
+        self._pause_blocked = False  # Playback thread is blocked in a pause and posts nothing
         self.playback_start_time = 0
         self.loop_current = 0
         self._updating_aspect = False  # Guard flag to prevent infinite recursion
         self._updating_seek = False  # Guard flag to prevent infinite recursion in seek
+        self._timing_key = None  # Settings last shown by update_timing_display
+        self._timing_pending = False  # update_timing_display queued for the next idle
+        self._aspect_after = None  # Pending debounced update_video_aspect call
+        self._font_index = None  # Font file name -> path, built on first export
+        self._default_font = None  # default_system_font() result once asked; "" if none
         
         self.note_values = {
             "1/32": 1/8, "1/16": 1/4, "1/8": 1/2, "1/4": 1,
@@ -111,6 +255,13 @@ class TextVideoPlayer:
         self.export_resolution = tk.StringVar(value="1920x1080")
         self.export_transparent = tk.BooleanVar(value=False)
         
+        # Settings the playback thread reads while running are mirrored into plain values,
+        # so the thread never has to call into Tcl
+        for var in (self.metronome_enabled, self.loop_enabled, self.loop_mode,
+                    self.loop_bars, self.loop_times, self.loop_infinite):
+            var.trace_add("write", self.sync_live_settings)
+        self.sync_live_settings()
+        
         if AUDIO_AVAILABLE:
             self.metronome_sound = MetronomeSound()
         
@@ -171,22 +322,22 @@ class TextVideoPlayer:
         loop_frame.pack(fill=tk.X, pady=10)
         
         ttk.Checkbutton(loop_frame, text="Enable Loop", variable=self.loop_enabled,
-                        command=self.update_timing_display).pack(anchor=tk.W)
+                        command=self.queue_timing_update).pack(anchor=tk.W)
         
         mode_frame = ttk.Frame(loop_frame)
         mode_frame.pack(fill=tk.X, pady=5)
         ttk.Label(mode_frame, text="Loop Mode:").pack(side=tk.LEFT)
         
         ttk.Radiobutton(mode_frame, text="All Words", variable=self.loop_mode,
-                        value="all_words", command=self.update_timing_display).pack(side=tk.LEFT, padx=5)
+                        value="all_words", command=self.queue_timing_update).pack(side=tk.LEFT, padx=5)
         ttk.Radiobutton(mode_frame, text="By Bars", variable=self.loop_mode,
-                        value="bars", command=self.update_timing_display).pack(side=tk.LEFT, padx=5)
+                        value="bars", command=self.queue_timing_update).pack(side=tk.LEFT, padx=5)
         
         bars_frame = ttk.Frame(loop_frame)
         bars_frame.pack(fill=tk.X, pady=5)
         ttk.Label(bars_frame, text="Loop Bars:").pack(side=tk.LEFT)
         bars_spin = ttk.Spinbox(bars_frame, from_=1, to=64, textvariable=self.loop_bars,
-                                 width=5, command=self.update_timing_display)
+                                 width=5, command=self.queue_timing_update)
         bars_spin.pack(side=tk.LEFT, padx=5)
         self.bars_duration_label = ttk.Label(bars_frame, text="= 0.00s")
         self.bars_duration_label.pack(side=tk.LEFT)
@@ -260,6 +411,12 @@ class TextVideoPlayer:
         self.video_canvas = tk.Canvas(self.video_container, bg=self.bg_color,
                                        highlightthickness=2, highlightbackground="gray")
         self.video_canvas.pack(expand=True)
+        self._canvas_bg = self.bg_color
+        self._render_key = None  # What display_word last drew
+        # Persistent text items (previous word below current) updated in place every frame
+        self._prev_text_id = self.video_canvas.create_text(0, 0, text="", anchor="center")
+        self._text_id = self.video_canvas.create_text(0, 0, text="", anchor="center")
+        self.video_canvas.bind("<Configure>", self.on_canvas_resize)
         
         progress_frame = ttk.Frame(video_frame)
         progress_frame.pack(pady=5)
@@ -287,18 +444,18 @@ class TextVideoPlayer:
         
         ttk.Label(bpm_frame, text="BPM:", font=("Arial", 11, "bold")).grid(row=0, column=0, sticky=tk.W)
         bpm_spin = ttk.Spinbox(bpm_frame, from_=20, to=300, textvariable=self.bpm, 
-                                width=6, command=self.update_timing_display)
+                                width=6, command=self.queue_timing_update)
         bpm_spin.grid(row=0, column=1, padx=5)
-        bpm_spin.bind("<KeyRelease>", lambda e: self.update_timing_display())
+        bpm_spin.bind("<KeyRelease>", self.queue_timing_update)
         
         ttk.Label(bpm_frame, text="Time Sig:").grid(row=0, column=2, padx=(20, 0))
         ttk.Spinbox(bpm_frame, from_=1, to=16, textvariable=self.time_signature_num, 
-                    width=4, command=self.update_timing_display).grid(row=0, column=3, padx=2)
+                    width=4, command=self.queue_timing_update).grid(row=0, column=3, padx=2)
         ttk.Label(bpm_frame, text="/").grid(row=0, column=4)
         ts_den = ttk.Combobox(bpm_frame, textvariable=self.time_signature_den,
                               values=[2, 4, 8, 16], state="readonly", width=4)
         ts_den.grid(row=0, column=5, padx=2)
-        ts_den.bind("<<ComboboxSelected>>", lambda e: self.update_timing_display())
+        ts_den.bind("<<ComboboxSelected>>", self.queue_timing_update)
         
         self.timing_info_label = ttk.Label(bpm_frame, text="", font=("Courier", 10))
         self.timing_info_label.grid(row=0, column=6, padx=(20, 0))
@@ -314,7 +471,7 @@ class TextVideoPlayer:
         word_combo = ttk.Combobox(note_frame, textvariable=self.word_note_value,
                                    values=note_values_list, state="readonly", width=8)
         word_combo.grid(row=0, column=1, padx=5)
-        word_combo.bind("<<ComboboxSelected>>", lambda e: self.update_timing_display())
+        word_combo.bind("<<ComboboxSelected>>", self.queue_timing_update)
         self.word_duration_label = ttk.Label(note_frame, text="= 0.000s", width=12)
         self.word_duration_label.grid(row=0, column=2)
         
@@ -322,7 +479,7 @@ class TextVideoPlayer:
         fade_in = ttk.Combobox(note_frame, textvariable=self.fade_in_note,
                                 values=gap_values_list, state="readonly", width=8)
         fade_in.grid(row=1, column=1, padx=5)
-        fade_in.bind("<<ComboboxSelected>>", lambda e: self.update_timing_display())
+        fade_in.bind("<<ComboboxSelected>>", self.queue_timing_update)
         self.fade_in_duration_label = ttk.Label(note_frame, text="= 0.000s", width=12)
         self.fade_in_duration_label.grid(row=1, column=2)
         
@@ -330,7 +487,7 @@ class TextVideoPlayer:
         fade_out = ttk.Combobox(note_frame, textvariable=self.fade_out_note,
                                  values=gap_values_list, state="readonly", width=8)
         fade_out.grid(row=2, column=1, padx=5)
-        fade_out.bind("<<ComboboxSelected>>", lambda e: self.update_timing_display())
+        fade_out.bind("<<ComboboxSelected>>", self.queue_timing_update)
         self.fade_out_duration_label = ttk.Label(note_frame, text="= 0.000s", width=12)
         self.fade_out_duration_label.grid(row=2, column=2)
         
@@ -338,11 +495,11 @@ class TextVideoPlayer:
         gap_frame.grid(row=3, column=0, columnspan=3, sticky=tk.W)
         ttk.Label(gap_frame, text="Gap:").pack(side=tk.LEFT)
         ttk.Checkbutton(gap_frame, text="Negative", variable=self.gap_negative,
-                        command=self.update_timing_display).pack(side=tk.LEFT, padx=10)
+                        command=self.queue_timing_update).pack(side=tk.LEFT, padx=10)
         gap_combo = ttk.Combobox(note_frame, textvariable=self.gap_note,
                                   values=gap_values_list, state="readonly", width=8)
         gap_combo.grid(row=3, column=1, padx=5)
-        gap_combo.bind("<<ComboboxSelected>>", lambda e: self.update_timing_display())
+        gap_combo.bind("<<ComboboxSelected>>", self.queue_timing_update)
         self.gap_duration_label = ttk.Label(note_frame, text="= 0.000s", width=12)
         self.gap_duration_label.grid(row=3, column=2)
         
@@ -361,6 +518,7 @@ class TextVideoPlayer:
                      command=self.update_metronome_volume, length=100).pack(side=tk.LEFT)
             
             self.beat_indicators = []
+            self._indicator_colors = ["#333"] * 16  # Colors currently shown by beat_indicators
             beat_frame = ttk.Frame(metro_frame)
             beat_frame.pack(pady=5)
             for i in range(16):
@@ -420,7 +578,7 @@ class TextVideoPlayer:
         self.seek_scale = ttk.Scale(seek_frame, from_=0, to=100, command=self.on_seek)
         self.seek_scale.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
         
-        self.video_container.bind("<Configure>", lambda e: self.update_video_aspect())
+        self.video_container.bind("<Configure>", self.schedule_video_aspect)
 
     # Start word controls
     def on_start_change(self, val):
@@ -431,7 +589,7 @@ class TextVideoPlayer:
             self.start_word_preview.config(text=f'"{self.words[idx-1]}"')
             self.current_word_index = idx - 1
             self.refresh_display()
-        self.update_timing_display()
+        self.queue_timing_update()
         
     def adjust_start(self, delta):
         new_val = max(1, min(len(self.words) if self.words else 1, self.start_word.get() + delta))
@@ -449,7 +607,7 @@ class TextVideoPlayer:
 
     def on_infinite_toggle(self):
         self.loop_times_spin.config(state="disabled" if self.loop_infinite.get() else "normal")
-        self.update_timing_display()
+        self.queue_timing_update()
 
     def note_to_seconds(self, note_str):
         if note_str == "0":
@@ -459,7 +617,55 @@ class TextVideoPlayer:
     def get_bar_seconds(self):
         return self.time_signature_num.get() * 60.0 / self.bpm.get()
 
+    def sync_live_settings(self, *_):
+        try:
+            self._live_settings = {
+                "metronome": self.metronome_enabled.get() and AUDIO_AVAILABLE,
+                "loop_enabled": self.loop_enabled.get(),
+                "loop_mode": self.loop_mode.get(),
+                "loop_bars": self.loop_bars.get(),
+                "loop_times": self.loop_times.get(),
+                "loop_infinite": self.loop_infinite.get(),
+            }
+            self._settings_dirty = True  # Picked up by the playback thread at its next beat
+        except tk.TclError:
+            pass  # A spinbox holds a partially typed value; keep the last valid settings
+
+    def get_playback_settings(self):
+        """Snapshot the timing settings on the Tk thread for the playback thread"""
+        gap = self.note_to_seconds(self.gap_note.get())
+        return {
+            "spb": 60.0 / self.bpm.get(),
+            "ts": self.time_signature_num.get(),
+            "word_dur": self.note_to_seconds(self.word_note_value.get()),
+            "fade_in": self.note_to_seconds(self.fade_in_note.get()),
+            "fade_out": self.note_to_seconds(self.fade_out_note.get()),
+            "gap": -gap if self.gap_negative.get() else gap,
+            "start_idx": self.start_word.get() - 1,
+            "count_in": self.count_in.get(),
+        }
+
+    def queue_timing_update(self, event=None):
+        # Coalesce bursts of changes (e.g. a slider drag) into one update when Tk goes idle
+        if not self._timing_pending:
+            self._timing_pending = True
+            self.root.after_idle(self._run_timing_update)
+
+    def _run_timing_update(self):
+        self._timing_pending = False
+        self.update_timing_display()
+
     def update_timing_display(self):
+        # Skip the label updates (and the redraws they trigger) when nothing changed
+        key = (self.bpm.get(), self.word_note_value.get(), self.fade_in_note.get(),
+               self.fade_out_note.get(), self.gap_note.get(), self.gap_negative.get(),
+               self.loop_enabled.get(), self.loop_mode.get(), self.loop_bars.get(),
+               self.loop_times.get(), self.loop_infinite.get(), self.time_signature_num.get(),
+               self.time_signature_den.get(), self.start_word.get(), len(self.words))
+        if key == self._timing_key:
+            return
+        self._timing_key = key
+        
         bpm = self.bpm.get()
         spb = 60.0 / bpm
         
@@ -485,8 +691,7 @@ class TextVideoPlayer:
         
         if AUDIO_AVAILABLE and hasattr(self, 'beat_indicators'):
             ts = self.time_signature_num.get()
-            for i, ind in enumerate(self.beat_indicators):
-                ind.config(bg="#333" if i < ts else "#111")
+            self.set_beat_indicators(tuple("#333" if i < ts else "#111" for i in range(16)))
 
     def update_duration_display(self):
         if not self.words:
@@ -525,7 +730,14 @@ class TextVideoPlayer:
             self.metronome_sound.click_sound.set_volume(v)
             self.metronome_sound.accent_sound.set_volume(v)
 
+    def schedule_video_aspect(self, event=None):
+        # Debounce: a window drag fires <Configure> for every pixel, only the last one matters
+        if self._aspect_after:
+            self.root.after_cancel(self._aspect_after)
+        self._aspect_after = self.root.after(50, self.update_video_aspect)
+
     def update_video_aspect(self):
+        self._aspect_after = None
         if self._updating_aspect:
             return
         self._updating_aspect = True
@@ -534,7 +746,7 @@ class TextVideoPlayer:
             cw = self.video_container.winfo_width()
             ch = self.video_container.winfo_height()
             if cw < 10 or ch < 10:
-                cw, ch = 640, 480
+                return  # Minimized or not laid out yet; <Configure> fires again once it is
             
             w, h = map(int, self.aspect_ratio.get().split(":"))
             ratio = w / h
@@ -552,8 +764,13 @@ class TextVideoPlayer:
             self._updating_aspect = False
 
     def load_text(self):
-        text = self.text_input.get("1.0", tk.END).strip()
-        self.words = text.split()
+        # No strip(): split() already drops surrounding whitespace, and strip() would copy
+        # the whole text
+        text = self.text_input.get("1.0", tk.END)
+        # Only re-split when the text actually changed; long lyric sheets are costly to split
+        if text != self._loaded_text:
+            self.words = tuple(text.split())
+            self._loaded_text = text
         self.current_word_index = 0
         
         n = len(self.words)
@@ -568,46 +785,43 @@ class TextVideoPlayer:
         self.update_timing_display()
         self.refresh_display()
 
-    def hex_to_rgb(self, hex_color):
-        h = hex_color.lstrip('#')
-        return tuple(int(h[i:i+2], 16) for i in (0, 2, 4))
-    
-    def blend_color(self, fg, bg, opacity):
-        fg_rgb = self.hex_to_rgb(fg)
-        bg_rgb = self.hex_to_rgb(bg)
-        blended = tuple(int(f * opacity + b * (1 - opacity)) for f, b in zip(fg_rgb, bg_rgb))
-        return '#{:02x}{:02x}{:02x}'.format(*blended)
+    def on_canvas_resize(self, event):
+        for item in (self._prev_text_id, self._text_id):
+            self.video_canvas.coords(item, event.width/2, event.height/2)
+
+    def set_canvas_bg(self, color):
+        # Changing bg repaints the whole canvas, so skip it when the color is unchanged
+        if color != self._canvas_bg:
+            self.video_canvas.config(bg=color)
+            self._canvas_bg = color
 
     def refresh_display(self, opacity=1.0):
-        self.video_canvas.delete("all")
-        self.video_canvas.config(bg=self.bg_color)
-        
+        word = None
         if self.words and 0 <= self.current_word_index < len(self.words):
             word = self.words[self.current_word_index]
-            cw = self.video_canvas.winfo_width()
-            ch = self.video_canvas.winfo_height()
-            font = (self.font_family.get(), self.font_size.get(), "bold")
-            color = self.blend_color(self.font_color, self.bg_color, opacity)
-            self.video_canvas.create_text(cw/2, ch/2, text=word, font=font, fill=color)
+        self.display_word(word, opacity)
 
     def display_word(self, word, opacity=1.0, prev_word=None, prev_opacity=0.0):
-        self.video_canvas.delete("all")
-        self.video_canvas.config(bg=self.bg_color)
-        cw = self.video_canvas.winfo_width()
-        ch = self.video_canvas.winfo_height()
         font = (self.font_family.get(), self.font_size.get(), "bold")
+        lut = fade_lut(self.font_color, self.bg_color)
+        cur = (word, lut[round(opacity * 255)]) if word and opacity > 0 else None
+        prev = (prev_word, lut[round(prev_opacity * 255)]) if prev_word and prev_opacity > 0 else None
         
-        if prev_word and prev_opacity > 0:
-            color = self.blend_color(self.font_color, self.bg_color, prev_opacity)
-            self.video_canvas.create_text(cw/2, ch/2, text=prev_word, font=font, fill=color)
+        # Nothing visible changed (items are re-centred separately on resize)
+        key = (cur, prev, font, self.bg_color)
+        if key == self._render_key:
+            return
+        self._render_key = key
         
-        if word and opacity > 0:
-            color = self.blend_color(self.font_color, self.bg_color, opacity)
-            self.video_canvas.create_text(cw/2, ch/2, text=word, font=font, fill=color)
+        self.set_canvas_bg(self.bg_color)
+        for item, shown in ((self._prev_text_id, prev), (self._text_id, cur)):
+            if shown:
+                self.video_canvas.itemconfig(item, text=shown[0], font=font, fill=shown[1])
+            else:
+                self.video_canvas.itemconfig(item, text="")
 
     def clear_display(self):
-        self.video_canvas.delete("all")
-        self.video_canvas.config(bg=self.bg_color)
+        self.display_word(None)
 
     def update_progress(self):
         start = self.start_word.get() - 1
@@ -630,12 +844,14 @@ class TextVideoPlayer:
         self.time_label.config(text=f"{mins}:{secs:06.3f}")
         
         if AUDIO_AVAILABLE and hasattr(self, 'beat_indicators'):
-            ts = self.time_signature_num.get()
-            for i, ind in enumerate(self.beat_indicators):
-                if i < ts:
-                    ind.config(bg="#F50" if i == beat and i == 0 else "#0F0" if i == beat else "#666")
-                else:
-                    ind.config(bg="#111")
+            self.set_beat_indicators(beat_colors(beat, self.time_signature_num.get()))
+
+    def set_beat_indicators(self, colors):
+        # Only reconfigure the indicators whose color actually changes
+        for i, (ind, color) in enumerate(zip(self.beat_indicators, colors)):
+            if color != self._indicator_colors[i]:
+                ind.config(bg=color)
+                self._indicator_colors[i] = color
 
     def update_loop_display(self):
         if self.loop_infinite.get():
@@ -650,7 +866,12 @@ class TextVideoPlayer:
                 return
         
         if self.is_paused:
-            self.is_paused = False
+            with self._pause_cond:
+                self.is_paused = False
+                self._pause_blocked = False
+                self._pause_cond.notify_all()
+            if self.playback_alive():
+                self.start_ui_drain()
             return
         
         if self.is_playing:
@@ -660,166 +881,264 @@ class TextVideoPlayer:
         self.loop_current = 0
         self.is_playing = True
         self.is_paused = False
-        self.play_thread = threading.Thread(target=self._playback_loop, daemon=True)
+        self._seek_to = None
+        self._wake.clear()
+        self.play_thread = threading.Thread(target=self._playback_loop,
+                                            args=(self.get_playback_settings(),), daemon=True)
         self.play_thread.start()
+        self.start_ui_drain()
 
-    def _playback_loop(self):
-        bpm = self.bpm.get()
-        spb = 60.0 / bpm
-        ts = self.time_signature_num.get()
-        
-        word_dur = self.note_to_seconds(self.word_note_value.get())
-        fade_in = self.note_to_seconds(self.fade_in_note.get())
-        fade_out = self.note_to_seconds(self.fade_out_note.get())
-        gap = self.note_to_seconds(self.gap_note.get())
-        if self.gap_negative.get():
-            gap = -gap
-        
-        start_idx = self.start_word.get() - 1
-        fade_steps = 20
+    def playback_alive(self):
+        return self.play_thread is not None and self.play_thread.is_alive()
+
+    def start_ui_drain(self):
+        if not self._ui_draining:
+            self._ui_draining = True
+            self.drain_ui_updates()
+
+    def drain_ui_updates(self):
+        """Apply what the playback thread posted, newest state only, at most ~60 times a second"""
+        try:
+            for key, update in (("word", self.display_word), ("beat", self.update_beat_display),
+                                ("progress", self.update_progress)):
+                args = self._ui_pending.pop(key, None)
+                if args is not None:
+                    try:
+                        update(*args)
+                    except tk.TclError:
+                        pass  # A spinbox holds a partially typed value; the next frame catches up
+            while self._ui_queue:
+                try:
+                    self._ui_queue.popleft()()
+                except tk.TclError:
+                    pass
+        finally:
+            # Always re-arm (or release) so one failing update can't freeze the UI for good.
+            # Idle while the thread is blocked in a pause; play() and stop() restart the drain.
+            if self._ui_pending or self._ui_queue or (self.playback_alive() and not self._pause_blocked):
+                self.root.after(16, self.drain_ui_updates)
+            else:
+                self._ui_draining = False
+
+    def build_word_schedule(self, settings, count):
+        """Per-word offsets in integer nanoseconds from the start of a pass, as parallel lists:
+        t_on (fade-in starts), t_full (fully shown), t_off (fade-out starts), t_end (slot ends)"""
+        fade_in = settings["fade_in"]
+        gap = settings["gap"]
+        main_dur = max(0.01, settings["word_dur"] - fade_in - settings["fade_out"])
+        fade_out = settings["fade_out"] if gap >= 0 else 0
+        fade_in_ns = round(fade_in * NS_PER_SEC)
+        main_ns = round(main_dur * NS_PER_SEC)
+        # Every word occupies the same slot, so offsets are exact multiples of it rather
+        # than a running sum of sleeps
+        step_ns = fade_in_ns + main_ns + round((fade_out + max(gap, 0)) * NS_PER_SEC)
+        t_on = [k * step_ns for k in range(count)]
+        return {
+            "t_on": t_on,
+            "t_full": [t + fade_in_ns for t in t_on],
+            "t_off": [t + fade_in_ns + main_ns for t in t_on],
+            "t_end": [t + step_ns for t in t_on],
+        }
+
+    def _playback_loop(self, settings):
+        # Ask Windows for 1 ms timer resolution, only while this thread is playing
+        if WINMM:
+            WINMM.timeBeginPeriod(1)
+        try:
+            self._run_playback(settings)
+        finally:
+            if WINMM:
+                WINMM.timeEndPeriod(1)
+
+    def _run_playback(self, settings):
+        # Runs off the Tk thread: reads only plain Python state and posts widget updates to
+        # _ui_pending / _ui_queue for drain_ui_updates
+        spb = settings["spb"]
+        spb_ns = round(spb * NS_PER_SEC)
+        ts = settings["ts"]
+        fade_in = settings["fade_in"]
+        fade_out = settings["fade_out"]
+        fade_in_ns = round(fade_in * NS_PER_SEC)
+        fade_out_ns = round(fade_out * NS_PER_SEC)
+        gap = settings["gap"]
+        start_idx = settings["start_idx"]
+        display_fps = 60
+        fade_in_steps = max(1, int(fade_in * display_fps))
+        fade_out_steps = max(1, int(fade_out * display_fps))
+        # Opacity and time offset of every fade step are fixed for the whole playback
+        fade_in_ops = [i / fade_in_steps for i in range(fade_in_steps + 1)]
+        fade_out_ops = [1.0 - i / fade_out_steps for i in range(fade_out_steps + 1)]
+        fade_in_offsets = [fade_in_ns * i // fade_in_steps for i in range(fade_in_steps + 1)]
+        fade_out_offsets = [fade_out_ns * i // fade_out_steps for i in range(fade_out_steps + 1)]
+        
+        words = self.words[start_idx:]
+        sched = self.build_word_schedule(settings, len(words))
+        t_on, t_full, t_off, t_end = sched["t_on"], sched["t_full"], sched["t_off"], sched["t_end"]
+        
+        # Local copy of the live settings, refreshed only when sync_live_settings changed them
+        live = metronome_on = None
+        
+        def refresh_live_settings():
+            nonlocal live, metronome_on
+            self._settings_dirty = False  # Cleared before reading so a concurrent change isn't lost
+            live = self._live_settings
+            metronome_on = live["metronome"]
+        
+        refresh_live_settings()
+        
+        def wait_until(deadline, seekable=True):
+            """Sleep until deadline (perf_counter_ns); False if stop() or a seek cut it short.
+            With seekable=False a seek doesn't end the wait and is left for the main loop."""
+            now = time.perf_counter_ns()
+            while now < deadline and self.is_playing and not (seekable and self._seek_to is not None):
+                self._wake.wait((deadline - now) / NS_PER_SEC)
+                if not seekable and self._seek_to is not None and self.is_playing:
+                    self._wake.clear()  # Woken by on_seek; keep waiting instead of spinning
+                now = time.perf_counter_ns()
+            return self.is_playing and not (seekable and self._seek_to is not None)
+        
+        def build_timeline(count):
+            """Time-ordered (offset, kind, payload) events for a pass over the first count words:
+            "word" starts a word, "show" is display_word arguments, "progress", "beat" n, and
+            "end" when the pass's last slot ends"""
+            events = []
+            for k in range(count):
+                word = words[k]
+                prev_word = words[k - 1] if k > 0 else None
+                events.append((t_on[k], "word", k))
+                if fade_in > 0:
+                    for op, offset in zip(fade_in_ops, fade_in_offsets):
+                        show = (word, op, prev_word, 1 - op) if gap < 0 and prev_word else (word, op)
+                        events.append((t_on[k] + offset, "show", show))
+                else:
+                    events.append((t_on[k], "show", (word, 1.0)))
+                events.append((t_full[k], "progress", None))
+                if fade_out > 0 and gap >= 0:
+                    for op, offset in zip(fade_out_ops, fade_out_offsets):
+                        events.append((t_off[k] + offset, "show", (word, op)))
+                if gap > 0:
+                    events.append((t_off[k] + (fade_out_ns if fade_out > 0 else 0), "show", (None,)))
+            if not count:
+                return events
+            # Beats up to the end of the pass; the next pass starts again from beat 0. The sort
+            # is stable, so a beat is handled before a display event at the same time.
+            beats = [(n * spb_ns, "beat", n) for n in range(-(-t_end[count - 1] // spb_ns))]
+            events = sorted(beats + events, key=lambda event: event[0])
+            events.append((t_end[count - 1], "end", None))
+            return events
+        
+        def pass_word_count():
+            """Words in a pass; bars mode plays every word that starts before the bar limit"""
+            if self._settings_dirty:
+                refresh_live_settings()
+            if live["loop_enabled"] and live["loop_mode"] == "bars":
+                return bisect.bisect_left(t_on, live["loop_bars"] * ts * spb_ns)
+            return len(words)
+        
+        # Build the first pass's timeline up front; its cost grows with words x fade steps
+        # and must not delay the count-in or the pass's first events
+        events_count = pass_word_count()
+        events = build_timeline(events_count)
+        event_times = [event[0] for event in events]
         
         # Count-in
-        if self.count_in.get():
+        if settings["count_in"]:
+            count_in_start = time.perf_counter_ns()
             for beat in range(ts):
                 if not self.is_playing:
                     return
-                beat_start = time.time()
-                if self.metronome_enabled.get() and AUDIO_AVAILABLE:
+                if self._settings_dirty:
+                    refresh_live_settings()
+                if metronome_on:
                     self.metronome_sound.play_click(accent=(beat == 0))
-                self.root.after(0, lambda b=beat: self.update_beat_display(b, -1, -(ts - b) * spb))
-                while time.time() - beat_start < spb:
-                    if not self.is_playing:
-                        return
-                    time.sleep(0.001)
+                self._ui_pending["beat"] = (beat, -1, -(ts - beat) * spb)
+                wait_until(count_in_start + (beat + 1) * spb_ns, seekable=False)
         
-        # Main playback with loop support
+        # Main playback with loop support: each pass dispatches its timeline against the clock
         while self.is_playing:
-            self.current_word_index = start_idx
-            loop_start = time.time()
-            self.playback_start_time = loop_start
-            metro_beat = 0
-            next_beat = 0.0
+            # Rebuilt only if the bars-mode word count changed, and before the pass is timed
+            count = pass_word_count()
+            if count != events_count:
+                events, events_count = build_timeline(count), count
+                event_times = [event[0] for event in events]
             
-            bar_duration = self.loop_bars.get() * self.get_bar_seconds()
+            self.current_word_index = start_idx
+            self.playback_start_time = time.perf_counter_ns()
             
-            self.root.after(0, self.update_loop_display)
+            self._ui_queue.append(self.update_loop_display)
             
-            while self.is_playing and self.current_word_index < len(self.words):
-                # Pause handling
-                while self.is_paused and self.is_playing:
-                    time.sleep(0.01)
-                
-                if not self.is_playing:
-                    break
-                
-                # Check bar-based loop end
-                if self.loop_enabled.get() and self.loop_mode.get() == "bars":
-                    if time.time() - loop_start >= bar_duration:
+            origin = self.playback_start_time
+            i = 0
+            while i < len(events):
+                t, kind, payload = events[i]
+                if not wait_until(origin + t):
+                    if not self.is_playing:
                         break
-                
-                word = self.words[self.current_word_index]
-                prev_word = self.words[self.current_word_index - 1] if self.current_word_index > start_idx else None
-                
-                # Fade in
-                if fade_in > 0:
-                    step_t = fade_in / fade_steps
-                    for i in range(fade_steps + 1):
-                        if not self.is_playing:
-                            break
-                        
-                        # Metronome check
-                        elapsed = time.time() - self.playback_start_time
-                        if elapsed >= next_beat:
-                            b = metro_beat % ts
-                            bar = metro_beat // ts
-                            if self.metronome_enabled.get() and AUDIO_AVAILABLE:
-                                self.metronome_sound.play_click(accent=(b == 0))
-                            self.root.after(0, lambda b=b, bar=bar, e=elapsed: self.update_beat_display(b, bar, e))
-                            metro_beat += 1
-                            next_beat = metro_beat * spb
-                        
-                        op = i / fade_steps
-                        if gap < 0 and prev_word:
-                            self.root.after(0, lambda w=word, o=op, pw=prev_word, po=1-op: self.display_word(w, o, pw, po))
-                        else:
-                            self.root.after(0, lambda w=word, o=op: self.display_word(w, o))
-                        time.sleep(step_t)
-                else:
-                    self.root.after(0, lambda w=word: self.display_word(w, 1.0))
-                
-                self.root.after(0, self.update_progress)
-                
-                # Main display
-                main_dur = max(0.01, word_dur - fade_in - fade_out)
-                end_time = time.time() + main_dur
-                
-                while time.time() < end_time and self.is_playing:
-                    elapsed = time.time() - self.playback_start_time
-                    if elapsed >= next_beat:
-                        b = metro_beat % ts
-                        bar = metro_beat // ts
-                        if self.metronome_enabled.get() and AUDIO_AVAILABLE:
-                            self.metronome_sound.play_click(accent=(b == 0))
-                        self.root.after(0, lambda b=b, bar=bar, e=elapsed: self.update_beat_display(b, bar, e))
-                        metro_beat += 1
-                        next_beat = metro_beat * spb
-                    time.sleep(0.001)
-                
-                # Fade out
-                if fade_out > 0 and gap >= 0:
-                    step_t = fade_out / fade_steps
-                    for i in range(fade_steps + 1):
-                        if not self.is_playing:
-                            break
-                        elapsed = time.time() - self.playback_start_time
-                        if elapsed >= next_beat:
-                            b = metro_beat % ts
-                            bar = metro_beat // ts
-                            if self.metronome_enabled.get() and AUDIO_AVAILABLE:
-                                self.metronome_sound.play_click(accent=(b == 0))
-                            self.root.after(0, lambda b=b, bar=bar, e=elapsed: self.update_beat_display(b, bar, e))
-                            metro_beat += 1
-                            next_beat = metro_beat * spb
-                        op = 1.0 - i / fade_steps
-                        self.root.after(0, lambda w=word, o=op: self.display_word(w, o))
-                        time.sleep(step_t)
-                
-                # Gap
-                if gap > 0:
-                    self.root.after(0, self.clear_display)
-                    end_time = time.time() + gap
-                    while time.time() < end_time and self.is_playing:
-                        elapsed = time.time() - self.playback_start_time
-                        if elapsed >= next_beat:
-                            b = metro_beat % ts
-                            bar = metro_beat // ts
-                            if self.metronome_enabled.get() and AUDIO_AVAILABLE:
-                                self.metronome_sound.play_click(accent=(b == 0))
-                            self.root.after(0, lambda b=b, bar=bar, e=elapsed: self.update_beat_display(b, bar, e))
-                            metro_beat += 1
-                            next_beat = metro_beat * spb
-                        time.sleep(0.001)
-                
-                self.current_word_index += 1
+                    # Seek: rebase the pass so the chosen word starts now, and resume from the
+                    # first event at its start
+                    k = min(max(self._seek_to - start_idx, 0), count - 1)
+                    self._seek_to = None
+                    self._wake.clear()
+                    origin = self.playback_start_time = time.perf_counter_ns() - t_on[k]
+                    i = bisect.bisect_left(event_times, t_on[k])
+                    continue
+                i += 1
+                if kind == "show":
+                    self._ui_pending["word"] = payload
+                elif kind == "beat":
+                    # Skip beats already overtaken by the next one, so running late never
+                    # bursts clicks; the display shows the scheduled beat time
+                    if time.perf_counter_ns() >= origin + t + spb_ns:
+                        continue
+                    if self._settings_dirty:
+                        refresh_live_settings()
+                    if metronome_on:
+                        self.metronome_sound.play_click(accent=(payload % ts == 0))
+                    self._ui_pending["beat"] = (payload % ts, payload // ts, t / NS_PER_SEC)
+                elif kind == "word":
+                    # Pause handling; shift the schedule so it resumes where it left off
+                    if self.is_paused:
+                        pause_start = time.perf_counter_ns()
+                        with self._pause_cond:
+                            self._pause_blocked = True
+                            while self.is_paused and self.is_playing:
+                                self._pause_cond.wait()
+                            self._pause_blocked = False
+                        self.playback_start_time += time.perf_counter_ns() - pause_start
+                        origin = self.playback_start_time
+                    if not self.is_playing:
+                        break
+                    self.current_word_index = start_idx + payload
+                elif kind == "progress":
+                    self._ui_pending["progress"] = ()
             
             # Loop logic
-            if not self.loop_enabled.get():
+            if self._settings_dirty:
+                refresh_live_settings()
+            if not live["loop_enabled"]:
                 break
             
             self.loop_current += 1
             
-            if not self.loop_infinite.get() and self.loop_current >= self.loop_times.get():
+            if not live["loop_infinite"] and self.loop_current >= live["loop_times"]:
                 break
         
         self.is_playing = False
-        self.root.after(0, lambda: self.progress_label.config(text="Complete"))
+        self._ui_queue.append(lambda: self.progress_label.config(text="Complete"))
 
     def pause(self):
         self.is_paused = True
 
     def stop(self):
-        self.is_playing = False
-        self.is_paused = False
+        with self._pause_cond:
+            self.is_playing = False
+            self.is_paused = False
+            self._pause_blocked = False
+            self._pause_cond.notify_all()
+        self._wake.set()
+        self._ui_pending.clear()  # Drop frames posted before the stop so they can't redraw
+        if self.playback_alive():
+            self.start_ui_drain()  # Let the thread's final updates through if it was paused
         self.current_word_index = self.start_word.get() - 1
         self.loop_current = 0
         self.clear_display()
@@ -828,8 +1147,7 @@ class TextVideoPlayer:
         self.beat_label.config(text="Beat: 0 | Bar: 0")
         self.time_label.config(text="0:00.000")
         if AUDIO_AVAILABLE and hasattr(self, 'beat_indicators'):
-            for ind in self.beat_indicators:
-                ind.config(bg="#333")
+            self.set_beat_indicators(("#333",) * 16)
 
     def restart(self):
         self.stop()
@@ -843,7 +1161,11 @@ class TextVideoPlayer:
             if self.words:
                 self.current_word_index = int(float(val))
                 self.update_progress()
-                if not self.is_playing:
+                if self.is_playing:
+                    # The playback thread picks this up and restarts from that word
+                    self._seek_to = self.current_word_index
+                    self._wake.set()
+                else:
                     self.refresh_display()
         finally:
             self._updating_seek = False
@@ -860,7 +1182,7 @@ class TextVideoPlayer:
         if color[1]:
             self.bg_color = color[1]
             self.bg_color_btn.config(bg=self.bg_color)
-            self.video_canvas.config(bg=self.bg_color)
+            self.set_canvas_bg(self.bg_color)
             self.refresh_display()
 
     def pick_screen_color(self):
@@ -921,7 +1243,7 @@ class TextVideoPlayer:
                 def apply_bg():
                     self.bg_color = hex_color
                     self.bg_color_btn.config(bg=hex_color)
-                    self.video_canvas.config(bg=hex_color)
+                    self.set_canvas_bg(hex_color)
                     self.refresh_display()
                     apply_win.destroy()
                 
@@ -936,7 +1258,8 @@ class TextVideoPlayer:
         picker_win.bind('<Button-1>', on_click)
         picker_win.bind('<Escape>', lambda e: picker_win.destroy())
 
-    def find_system_font(self, family):
+    def index_system_fonts(self):
+        """Map lowercase, space-free font file names to paths, first found wins"""
         import platform
         system = platform.system()
         
@@ -947,20 +1270,61 @@ class TextVideoPlayer:
         else:
             dirs = ['/usr/share/fonts', '/usr/local/share/fonts', os.path.expanduser('~/.fonts')]
         
-        name = family.lower().replace(' ', '')
+        index = {}
         for d in dirs:
             if os.path.exists(d):
                 for root, _, files in os.walk(d):
                     for f in files:
-                        if f.lower().endswith(('.ttf', '.otf')) and name in f.lower().replace(' ', ''):
-                            return os.path.join(root, f)
+                        if f.lower().endswith(('.ttf', '.otf')):
+                            index.setdefault(f.lower().replace(' ', ''), os.path.join(root, f))
+        return index
+
+    def default_system_font(self):
+        """Ask the platform for its Arial (or closest substitute) instead of scanning the index"""
+        import platform
+        system = platform.system()
         
-        for d in dirs:
-            if os.path.exists(d):
-                for root, _, files in os.walk(d):
-                    for f in ['arial.ttf', 'Arial.ttf', 'DejaVuSans.ttf']:
-                        if f in files:
-                            return os.path.join(root, f)
+        if system == "Windows":
+            candidates = [os.path.join(os.environ.get('WINDIR', 'C:\\Windows'), 'Fonts', 'arial.ttf')]
+        elif system == "Darwin":
+            candidates = ['/System/Library/Fonts/Supplemental/Arial.ttf', '/Library/Fonts/Arial.ttf',
+                          '/System/Library/Fonts/Helvetica.ttc']
+        else:
+            # fontconfig resolves Arial to whichever sans font substitutes for it
+            try:
+                result = subprocess.run(['fc-match', '-f', '%{file}', 'Arial'],
+                                        capture_output=True, text=True, timeout=5)
+                candidates = [result.stdout.strip()]
+            except (OSError, subprocess.SubprocessError):
+                candidates = []
+        
+        for path in candidates:
+            if path and os.path.isfile(path):
+                return path
+        return None
+
+    def find_system_font(self, family):
+        # Walking the font directories is slow, so it is done once and kept for later exports
+        if self._font_index is None:
+            self._font_index = self.index_system_fonts()
+        index = self._font_index
+        
+        name = family.lower().replace(' ', '')
+        for ext in ('.ttf', '.otf'):
+            if name + ext in index:
+                return index[name + ext]
+        for key, path in index.items():
+            if name in key:
+                return path
+        
+        # Asking the platform may spawn fc-match, so that is also done only once
+        if self._default_font is None:
+            self._default_font = self.default_system_font() or ""
+        if self._default_font:
+            return self._default_font
+        for key in ('arial.ttf', 'dejavusans.ttf'):
+            if key in index:
+                return index[key]
         return None
 
     def export_video(self):
@@ -998,9 +1362,18 @@ class TextVideoPlayer:
         
         threading.Thread(target=self._export_thread, args=(filename,), daemon=True).start()
 
+    def set_export_status(self, text, progress=None):
+        """Show export status text, and progress (0-100) if given; scheduled from the export thread"""
+        self.export_status.config(text=text)
+        if progress is not None:
+            self.export_progress.config(value=progress)
+
     def _export_thread(self, filename):
+        encoder = None
+        writer = None
+        out = None
         try:
-            self.root.after(0, lambda: self.export_status.config(text="Preparing..."))
+            self.root.after(0, self.set_export_status, "Preparing...")
             
             w, h = map(int, self.export_resolution.get().split('x'))
             fps = self.export_fps.get()
@@ -1015,50 +1388,49 @@ class TextVideoPlayer:
                 os.makedirs(filename, exist_ok=True)
                 out = None
             else:
-                # Determine FourCC codec based on format
-                if fmt == "prores4444":
-                    fourcc = cv2.VideoWriter_fourcc(*'ap4h')  # ProRes 4444
-                elif fmt in ['mp4', 'mov']:
-                    fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-                else:
-                    fourcc = cv2.VideoWriter_fourcc(*'XVID')
-                
                 # For ProRes 4444 with transparency, we need BGRA (4 channels)
                 is_prores_alpha = (fmt == "prores4444" and use_transparency)
+                ffmpeg = shutil.which("ffmpeg") if fmt == "prores4444" else None
                 
-                # Create VideoWriter with appropriate channel count
-                if is_prores_alpha:
+                if ffmpeg:
+                    # Pipe raw frames straight to FFmpeg's ProRes encoder, alpha included
+                    out = FFmpegWriter(ffmpeg, filename, fps, (w, h), use_transparency)
+                elif is_prores_alpha:
                     # ProRes 4444 with alpha requires special handling
                     # OpenCV may not fully support BGRA VideoWriter on all platforms
                     # We'll attempt it and fallback to PNG sequence if it fails
                     try:
-                        out = cv2.VideoWriter(filename, fourcc, fps, (w, h), True)
+                        out = cv2.VideoWriter(filename, cv2.VideoWriter_fourcc(*'ap4h'), fps, (w, h), True)
                         if not out.isOpened():
                             raise Exception("ProRes with alpha not supported by OpenCV")
                     except Exception:
-                        self.root.after(0, lambda: messagebox.showwarning(
+                        self.root.after(0, messagebox.showwarning,
                             "Warning", 
                             "ProRes 4444 with transparency not fully supported by OpenCV.\n"
-                            "Exporting as PNG sequence instead.\n"
+                            "Exporting as PNG sequence instead (install FFmpeg to export ProRes directly).\n"
                             "Use FFmpeg to convert: ffmpeg -i frame_%06d.png -c:v prores_ks -profile:v 4444 -pix_fmt yuva444p10le output.mov"
-                        ))
+                        )
                         # Fallback to PNG sequence
                         filename = tempfile.mkdtemp(prefix="prores_frames_")
                         is_png_seq = True
                         out = None
+                elif fmt == "prores4444":
+                    out = cv2.VideoWriter(filename, cv2.VideoWriter_fourcc(*'ap4h'), fps, (w, h))  # ProRes 4444
+                elif fmt in ['mp4', 'mov']:
+                    # H.264 where OpenCV's FFmpeg backend has an encoder for it, else MPEG-4 Part 2
+                    out = cv2.VideoWriter(filename, cv2.CAP_FFMPEG, cv2.VideoWriter_fourcc(*'avc1'), fps, (w, h))
+                    if not out.isOpened():
+                        out = cv2.VideoWriter(filename, cv2.VideoWriter_fourcc(*'mp4v'), fps, (w, h))
                 else:
-                    out = cv2.VideoWriter(filename, fourcc, fps, (w, h))
+                    out = cv2.VideoWriter(filename, cv2.VideoWriter_fourcc(*'XVID'), fps, (w, h))
                 
                 if not is_png_seq and not out.isOpened():
-                    self.root.after(0, lambda: messagebox.showerror("Error", "Failed to create video"))
+                    self.root.after(0, messagebox.showerror, "Error", "Failed to create video")
                     return
             
             font_path = self.find_system_font(self.font_family.get())
             font_size = int(self.font_size.get() * h / 1080)
-            try:
-                pil_font = ImageFont.truetype(font_path, font_size) if font_path else ImageFont.load_default()
-            except:
-                pil_font = ImageFont.load_default()
+            pil_font = get_pil_font(font_path, font_size)
             
             word_dur = self.note_to_seconds(self.word_note_value.get())
             fade_in = self.note_to_seconds(self.fade_in_note.get())
@@ -1073,12 +1445,32 @@ class TextVideoPlayer:
             gap_f = int(abs(gap) * fps) if gap > 0 else 0
             main_f = max(1, word_f - fade_in_f - fade_out_f)
             
-            bg = self.hex_to_rgb(self.bg_color)
-            fg = self.hex_to_rgb(self.font_color)
+            bg = hex_to_rgb(self.bg_color)
+            fg = hex_to_rgb(self.font_color)
+            
+            fg_bgr = np.array(fg[::-1], dtype=np.float32)
+            bg_bgr = np.array(bg[::-1], dtype=np.float32)
+            
+            # One background template for the whole export; each frame starts as a copy of it
+            # and only the text region is rendered
+            bg_frame = np.empty((h, w, 4 if use_transparency else 3), dtype=np.uint8)
+            bg_frame[:] = (0, 0, 0, 0) if use_transparency else bg[::-1]
             
             start_idx = self.start_word.get() - 1
             words_to_export = self.words[start_idx:]
             
+            # Text metrics depend only on the word, so shape each distinct word once
+            measure = ImageDraw.Draw(Image.new('RGB', (1, 1)))
+            text_boxes = {word: measure.textbbox((0, 0), word, font=pil_font) for word in set(words_to_export)}
+            
+            # Rasterize each distinct word once: its anti-aliased coverage over its text box.
+            # Every frame is then blended from these sprites without touching PIL.
+            sprites = {}
+            for word, bbox in text_boxes.items():
+                sprite = Image.new('L', (bbox[2] - bbox[0], bbox[3] - bbox[1]), 0)
+                ImageDraw.Draw(sprite).text((-bbox[0], -bbox[1]), word, font=pil_font, fill=255)
+                sprites[word] = np.asarray(sprite)
+            
             # Calculate loops
             if self.loop_enabled.get():
                 if self.loop_mode.get() == "bars":
@@ -1092,16 +1484,151 @@ class TextVideoPlayer:
             frame_count = 0
             
             # Helper function to write frames
+            # PNG encoding runs on a thread pool (cv2.imencode releases the GIL)
+            if is_png_seq:
+                encoder = ThreadPoolExecutor(max_workers=min(os.cpu_count() or 1, 8))
+            
+            # Frames are handed to a writer thread through a bounded queue, so rendering
+            # overlaps with encoding and disk I/O. They are rendered into a ring of buffers
+            # two longer than the queue, so a buffer is never reused while still queued.
+            frames = queue.Queue(maxsize=8)
+            ring = [np.empty_like(bg_frame) for _ in range(frames.maxsize + 2)]
+            ring_pos = 0
+            write_errors = []
+            
+            def next_buffer():
+                nonlocal ring_pos
+                ring_pos = (ring_pos + 1) % len(ring)
+                return ring[ring_pos]
+            
+            def write_queued_frames():
+                """Writer thread: (None, frame) for video, (path, encoded PNG future) or
+                (path, path of an earlier identical frame to link) for PNG sequences"""
+                while True:
+                    item = frames.get()
+                    if item is None:
+                        return
+                    if write_errors:
+                        continue  # Keep draining so the render thread never blocks
+                    path, job = item
+                    try:
+                        if path is None:
+                            out.write(job)
+                        elif isinstance(job, str):
+                            try:
+                                os.link(job, path)
+                            except OSError:
+                                shutil.copyfile(job, path)  # Filesystem without hardlinks
+                        else:
+                            ok, buf = job.result()
+                            if not ok:
+                                raise Exception(f"Failed to encode {path}")
+                            buf.tofile(path)
+                    except Exception as e:
+                        write_errors.append(e)
+            
+            writer = threading.Thread(target=write_queued_frames, daemon=True)
+            writer.start()
+            
+            def png_path(index):
+                path = os.path.join(filename, f"frame_{index:06d}.png")
+                if os.path.exists(path):
+                    os.remove(path)  # May be hardlinked to another frame by an earlier export
+                return path
+            
             def write_frame(frame_data):
                 nonlocal frame_count
+                if write_errors:
+                    raise write_errors[0]
                 if is_png_seq:
                     # Save as PNG
-                    png_path = os.path.join(filename, f"frame_{frame_count:06d}.png")
-                    cv2.imwrite(png_path, frame_data)
+                    frames.put((png_path(frame_count), encoder.submit(cv2.imencode, '.png', frame_data)))
                 else:
-                    out.write(frame_data)
+                    frames.put((None, frame_data))
                 frame_count += 1
             
+            def write_repeated(frame_data, count, source=None):
+                """Write count identical frames; PNG sequences encode once, or not at all if
+                source names an identical PNG already written, and link the rest to it.
+                Returns the PNG the frames were linked to."""
+                nonlocal frame_count
+                if count <= 0:
+                    return source
+                if not is_png_seq:
+                    for _ in range(count):
+                        write_frame(frame_data)
+                    return None
+                if source is None:
+                    source = os.path.join(filename, f"frame_{frame_count:06d}.png")
+                    write_frame(frame_data)
+                    count -= 1
+                for _ in range(count):
+                    frames.put((png_path(frame_count), source))
+                    frame_count += 1
+                return source
+            
+            blank_png = None  # First blank frame of a PNG sequence; later gaps link to it
+            
+            def coverage(texts):
+                """Coverage (0-1) of each text centred in the frame, over the union of their boxes
+                clipped to the frame; no box or masks if off-frame"""
+                placed = []
+                for text in texts:
+                    bbox = text_boxes[text]
+                    placed.append((text, (w - bbox[2] + bbox[0]) // 2, (h - bbox[3] + bbox[1]) // 2, bbox))
+                x0 = max(0, min(x + bbox[0] for _, x, _, bbox in placed))
+                y0 = max(0, min(y + bbox[1] for _, _, y, bbox in placed))
+                x1 = min(w, max(x + bbox[2] for _, x, _, bbox in placed))
+                y1 = min(h, max(y + bbox[3] for _, _, y, bbox in placed))
+                if x0 >= x1 or y0 >= y1:
+                    return None, [None] * len(texts)
+                masks = []
+                for text, x, y, bbox in placed:
+                    sprite = sprites[text]
+                    sx, sy = x + bbox[0], y + bbox[1]  # Sprite's top-left corner in the frame
+                    cx0, cy0 = max(sx, x0), max(sy, y0)
+                    cx1, cy1 = min(sx + sprite.shape[1], x1), min(sy + sprite.shape[0], y1)
+                    mask = np.zeros((y1 - y0, x1 - x0), dtype=np.float32)
+                    if cx0 < cx1 and cy0 < cy1:
+                        mask[cy0 - y0:cy1 - y0, cx0 - x0:cx1 - x0] = sprite[cy0 - sy:cy1 - sy, cx0 - sx:cx1 - sx]
+                        mask /= 255
+                    masks.append(mask)
+                return (x0, y0, x1, y1), masks
+            
+            def blend_frames(rect, mask, ops, prev_mask=None):
+                """Yield one frame per opacity in ops by blending the word's coverage mask, with
+                the previous word fading the other way under it when prev_mask is given. Frames
+                are computed as one array per batch instead of being drawn one by one."""
+                if rect is None:
+                    for _ in ops:
+                        yield bg_frame
+                    return
+                x0, y0, x1, y1 = rect
+                for start in range(0, len(ops), 16):  # Batches bound memory for long fades
+                    op = np.array(ops[start:start + 16], dtype=np.float32)[:, None, None]
+                    # Share of the text color in each pixel; a word at zero opacity isn't drawn,
+                    # otherwise it is drawn over the previous word as on the canvas
+                    k = mask * op
+                    if prev_mask is not None:
+                        k += prev_mask * (1 - op) * (1 - mask * (op > 0))
+                    if use_transparency:
+                        patches = np.empty(k.shape + (4,), dtype=np.uint8)
+                        # Straight alpha: full text color wherever either word has coverage
+                        shown = mask > 0 if prev_mask is None else (mask > 0) | (prev_mask > 0)
+                        patches[..., :3] = np.where(shown[..., None], fg_bgr, 0).astype(np.uint8)
+                        patches[..., 3] = (k * 255 + 0.5).astype(np.uint8)
+                    else:
+                        patches = (bg_bgr + k[..., None] * (fg_bgr - bg_bgr) + 0.5).astype(np.uint8)
+                    for patch in patches:
+                        frame = next_buffer()
+                        np.copyto(frame, bg_frame)
+                        frame[y0:y1, x0:x1] = patch
+                        yield frame
+            
+            def write_fade(rect, mask, ops, prev_mask=None):
+                for frame in blend_frames(rect, mask, ops, prev_mask):
+                    write_frame(frame)
+            
             for loop in range(loops):
                 word_idx = 0
                 loop_frames = 0
@@ -1112,110 +1639,72 @@ class TextVideoPlayer:
                     prev_word = words_to_export[word_idx - 1] if word_idx > 0 else None
                     
                     progress = int(((loop * len(words_to_export) + word_idx) / (loops * len(words_to_export))) * 100)
-                    self.root.after(0, lambda p=progress: self.export_progress.config(value=p))
-                    self.root.after(0, lambda l=loop+1, t=loops, i=word_idx+1, n=len(words_to_export): 
-                                   self.export_status.config(text=f"Loop {l}/{t} - Word {i}/{n}"))
+                    self.root.after(0, self.set_export_status,
+                                    f"Loop {loop + 1}/{loops} - Word {word_idx + 1}/{len(words_to_export)}", progress)
                     
-                    # Fade in
-                    for i in range(fade_in_f):
-                        if loop_frames >= bar_limit:
-                            break
-                        op = i / fade_in_f if fade_in_f > 0 else 1.0
-                        pop = 1.0 - op if gap < 0 and prev_word else 0.0
-                        frame = self._render_frame(w, h, word, op, prev_word, pop, pil_font, bg, fg, use_transparency)
-                        write_frame(frame)
-                        loop_frames += 1
+                    # Fade in, crossfading from the previous word when the gap is negative
+                    crossfade = gap < 0 and prev_word
+                    if crossfade:
+                        rect, (prev_mask, mask) = coverage((prev_word, word))
+                    else:
+                        rect, (mask,) = coverage((word,))
+                    count = int(min(fade_in_f, bar_limit - loop_frames))
+                    write_fade(rect, mask, [i / fade_in_f for i in range(count)], prev_mask if crossfade else None)
+                    loop_frames += count
                     
-                    # Main
-                    for _ in range(main_f):
-                        if loop_frames >= bar_limit:
-                            break
-                        frame = self._render_frame(w, h, word, 1.0, None, 0, pil_font, bg, fg, use_transparency)
-                        write_frame(frame)
-                        loop_frames += 1
+                    # Main: every frame is identical, so blend it once at full opacity
+                    count = int(min(main_f, bar_limit - loop_frames))
+                    if count > 0:
+                        frame, = blend_frames(rect, mask, [1.0])
+                        write_repeated(frame, count)
+                        loop_frames += count
                     
                     # Fade out
                     if gap >= 0:
-                        for i in range(fade_out_f):
-                            if loop_frames >= bar_limit:
-                                break
-                            op = 1.0 - i / fade_out_f if fade_out_f > 0 else 0.0
-                            frame = self._render_frame(w, h, word, op, None, 0, pil_font, bg, fg, use_transparency)
-                            write_frame(frame)
-                            loop_frames += 1
+                        count = int(min(fade_out_f, bar_limit - loop_frames))
+                        write_fade(rect, mask, [1.0 - i / fade_out_f for i in range(count)])
+                        loop_frames += count
                     
-                    # Gap
+                    # Gap: a blank frame is exactly the background template
                     if gap > 0:
-                        blank = self._render_frame(w, h, "", 0, None, 0, pil_font, bg, fg, use_transparency)
-                        for _ in range(gap_f):
-                            if loop_frames >= bar_limit:
-                                break
-                            write_frame(blank)
-                            loop_frames += 1
+                        count = int(min(gap_f, bar_limit - loop_frames))
+                        blank_png = write_repeated(bg_frame, count, blank_png)
+                        loop_frames += count
                     
                     word_idx += 1
             
+            frames.put(None)
+            writer.join()
+            if write_errors:
+                raise write_errors[0]
             if not is_png_seq:
                 out.release()
+                out = None
             
             dur = frame_count / fps
-            self.root.after(0, lambda: self.export_progress.config(value=100))
-            self.root.after(0, lambda: self.export_status.config(text="Complete!"))
-            self.root.after(0, lambda: messagebox.showinfo("Success", 
-                f"Exported: {filename}\nFrames: {frame_count}\nDuration: {dur:.1f}s"))
+            self.root.after(0, self.set_export_status, "Complete!", 100)
+            self.root.after(0, messagebox.showinfo, "Success",
+                            f"Exported: {filename}\nFrames: {frame_count}\nDuration: {dur:.1f}s")
             
         except Exception as e:
-            self.root.after(0, lambda: self.export_status.config(text=f"Error: {e}"))
-            self.root.after(0, lambda: messagebox.showerror("Error", str(e)))
-
-    def _render_frame(self, w, h, word, op, prev_word, prev_op, font, bg, fg, use_alpha=False):
-        """Render a single frame with optional alpha channel for transparency"""
-        if use_alpha:
-            # Create RGBA image for transparency
-            img = Image.new('RGBA', (w, h), (0, 0, 0, 0))  # Transparent background
-            draw = ImageDraw.Draw(img)
-            
-            if prev_word and prev_op > 0:
-                # Calculate color with alpha
-                alpha = int(255 * prev_op)
-                color = (*fg, alpha)
-                bbox = draw.textbbox((0, 0), prev_word, font=font)
-                x = (w - bbox[2] + bbox[0]) // 2
-                y = (h - bbox[3] + bbox[1]) // 2
-                draw.text((x, y), prev_word, font=font, fill=color)
-            
-            if word and op > 0:
-                # Calculate color with alpha
-                alpha = int(255 * op)
-                color = (*fg, alpha)
-                bbox = draw.textbbox((0, 0), word, font=font)
-                x = (w - bbox[2] + bbox[0]) // 2
-                y = (h - bbox[3] + bbox[1]) // 2
-                draw.text((x, y), word, font=font, fill=color)
-            
-            # Convert RGBA to BGRA for OpenCV
-            return cv2.cvtColor(np.array(img), cv2.COLOR_RGBA2BGRA)
-        else:
-            # Original RGB rendering with background
-            img = Image.new('RGB', (w, h), bg)
-            draw = ImageDraw.Draw(img)
-            
-            if prev_word and prev_op > 0:
-                color = tuple(int(f * prev_op + b * (1 - prev_op)) for f, b in zip(fg, bg))
-                bbox = draw.textbbox((0, 0), prev_word, font=font)
-                x = (w - bbox[2] + bbox[0]) // 2
-                y = (h - bbox[3] + bbox[1]) // 2
-                draw.text((x, y), prev_word, font=font, fill=color)
-            
-            if word and op > 0:
-                color = tuple(int(f * op + b * (1 - op)) for f, b in zip(fg, bg))
-                bbox = draw.textbbox((0, 0), word, font=font)
-                x = (w - bbox[2] + bbox[0]) // 2
-                y = (h - bbox[3] + bbox[1]) // 2
-                draw.text((x, y), word, font=font, fill=color)
-            
-            return cv2.cvtColor(np.array(img), cv2.COLOR_RGB2BGR)
-    
+            self.root.after(0, self.set_export_status, f"Error: {e}")
+            self.root.after(0, messagebox.showerror, "Error", str(e))
+        finally:
+            if writer is not None and writer.is_alive():
+                frames.put(None)
+                writer.join()
+            if out is not None:
+                # The export failed: close the half-written output, abandoning an FFmpeg pipe
+                try:
+                    if isinstance(out, FFmpegWriter):
+                        out.kill()
+                    else:
+                        out.release()
+                except Exception:
+                    pass  # Already reporting the original error
+            if encoder is not None:
+                encoder.shutdown(cancel_futures=True)
+
     def export_settings(self):
         """Export all settings and text to a JSON file"""
         filename = filedialog.asksaveasfilename(
@@ -1316,7 +1805,7 @@ class TextVideoPlayer:
             if "bg_color" in settings:
                 self.bg_color = settings["bg_color"]
                 self.bg_color_btn.config(bg=self.bg_color)
-                self.video_canvas.config(bg=self.bg_color)
+                self.set_canvas_bg(self.bg_color)
             if "aspect_ratio" in settings:
                 self.aspect_ratio.set(settings["aspect_ratio"])
             if "export_fps" in settings: